@@ -9,5 +9,6 @@ The `unsafe` may contain but not limited to the following situations:
 """
 
 from .busy_impl import busy  # noqa: F401
+from .lambdify_impl import lambdify  # noqa: F401
 from .load_check import LoadChecker  # noqa: F401
 from .sanitize_impl import sanitize  # noqa: F401
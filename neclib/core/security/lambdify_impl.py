@@ -0,0 +1,98 @@
+"""Convert user-supplied arithmetic expression into a function, without ``eval``."""
+
+import ast
+import functools
+import operator
+from typing import Any, Callable, Union
+
+from .sanitize_impl import sanitize
+
+_BinaryOperators = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+}
+_UnaryOperators = {ast.UAdd: operator.pos, ast.USub: operator.neg}
+
+
+def _identity(x: Any, /) -> Any:
+    return x
+
+
+def _compile(node: ast.AST, variable: str) -> Union[Callable[[Any], Any], int, float]:
+    # Sub-trees which don't depend on the variable are folded into a number, so that
+    # common forms such as ``a * x + b`` evaluate only 2 operations per call.
+    if isinstance(node, ast.Expression):
+        return _compile(node.body, variable)
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        return node.value
+    if isinstance(node, ast.Name) and (node.id == variable):
+        return _identity
+
+    if isinstance(node, ast.UnaryOp) and (type(node.op) in _UnaryOperators):
+        unary_op = _UnaryOperators[type(node.op)]
+        operand = _compile(node.operand, variable)
+        if not callable(operand):
+            return unary_op(operand)
+        if operand is _identity:
+            return unary_op
+        return lambda x: unary_op(operand(x))
+
+    if isinstance(node, ast.BinOp) and (type(node.op) in _BinaryOperators):
+        op = _BinaryOperators[type(node.op)]
+        left = _compile(node.left, variable)
+        right = _compile(node.right, variable)
+        if not (callable(left) or callable(right)):
+            return op(left, right)
+        if not callable(left):
+            if right is _identity:
+                return functools.partial(op, left)
+            return lambda x: op(left, right(x))
+        if not callable(right):
+            if left is _identity:
+                return lambda x: op(x, right)
+            return lambda x: op(left(x), right)
+        return lambda x: op(left(x), right(x))
+
+    raise ValueError(f"Unsupported expression {ast.unparse(node)!r}.")
+
+
+def lambdify(
+    content: str, variable: str = "x", max_length: int = 100
+) -> Callable[[Any], Any]:
+    """Convert arithmetic expression of single variable into a function.
+
+    Only numeric literals, the variable and arithmetic operators (``+``, ``-``, ``*``,
+    ``/``, ``//``, ``%`` and ``**``) are accepted. The returned function applies
+    element-wise to array-like input such as ``np.ndarray``.
+
+    Parameters
+    ----------
+    content
+        The expression, e.g. ``"x * 10"``.
+    variable
+        Name of the variable in the expression.
+    max_length
+        Maximum length of the expression.
+
+    Raises
+    ------
+    ValueError
+        If the expression contains anything other than the above.
+
+    Examples
+    --------
+    >>> f = neclib.core.security.lambdify("x / 3 + 1")
+    >>> f(6)
+    3.0
+
+    """
+    sanitize(content, variable, max_length=max_length)
+    func = _compile(ast.parse(content.strip(), mode="eval"), variable)
+    if callable(func):
+        return func
+    return lambda x: func
@@ -1,8 +1,11 @@
-from typing import Callable, Dict, List
+import threading
+import time
+from typing import Any, Dict, List, Optional
 
 import astropy.units as u
+import numpy as np
 
-from ...core.security import busy, sanitize
+from ...core.security import lambdify
 from .ad_converter_base import ADConverter
 
 
@@ -90,70 +93,182 @@ class CPZ3177(ADConverter):
         self.single_diff = self.Config.single_diff
         self.all_ch_num = self.Config.all_ch_num
         self.ch_range = self.Config.ch_range
-        self.smpl_ch_req = [
-            {"ch_no": i, "range": self.ch_range}
-            for i in range(1, self.all_ch_num + 1, 1)
-        ]
+        self.smpl_num = 1000
+        self._converter: Optional[List[Dict[str, Any]]] = None
+        self._conv_by_ch: Dict[str, Dict[str, Any]] = {}
+        self._conv_by_target: Dict[str, List[Dict[str, Any]]] = {}
+        self._cols_by_target: Dict[str, np.ndarray] = {}
+        self._units_by_target: Dict[str, List[u.UnitBase]] = {}
+        self._unit_by_ch: Dict[str, u.UnitBase] = {}
+        # Zero-based column index of each channel in the sampled data.
+        self._ch0 = {k: v - 1 for k, v in self.Config.channel.items()}
+        # The driver looks up ``r["ch_no"]`` and ``r["range"]`` of each request on
+        # every sampling cycle, so the entries have to stay mappings.
+        self.smpl_ch_req = tuple(
+            {"ch_no": i, "range": self.ch_range} for i in range(1, self.all_ch_num + 1)
+        )
 
         self.ad = pyinterface.open(3177, self.rsw_id)
         self.ad.stop_sampling()
         self.ad.initialize()
         self.ad.set_sampling_config(
             smpl_ch_req=self.smpl_ch_req,
-            smpl_num=1000,
+            smpl_num=self.smpl_num,
             smpl_freq=self.smpl_freq,
             single_diff=self.single_diff,
             trig_mode="ETERNITY",
         )
         self.ad.start_sampling("ASYNC")
 
+        self._lock = threading.Lock()
+        self._attach_buffer()
+
+    def _attach_buffer(self) -> None:
+        # The driver stores the samples in a shared ``float32`` ring buffer, which is
+        # (re)allocated on ``start_sampling``. View it in place, instead of letting
+        # ``read_sampling_buffer`` box every value into Python floats.
+        self._buffer_src = self.ad.buffer
+        self._buffer = np.ctypeslib.as_array(self._buffer_src.get_obj()).reshape(
+            -1, self.all_ch_num
+        )
+        self._started = time.monotonic()
+        self._last_count = 0
+        self._filled = False
+        self._clear_cache()
+
+    def _clear_cache(self) -> None:
+        self._cache_count = -1
+        self._cache_time = 0.0
+        self._mean_all: Optional[np.ndarray] = None
+        self._mean_ch: Dict[int, float] = {}
+
+    def _read_buffer(self) -> np.ndarray:
+        """Latest ``ave_num`` samples, shaped ``(ave_num, all_ch_num)``."""
+        if self.ad.buffer is not self._buffer_src:
+            # Sampling was restarted, so the view points to the released buffer.
+            self._attach_buffer()
+        end = self.ad.get_status()["smpl_count"]
+        if end < self._last_count:
+            # The sample counter only decreases when the ring buffer wraps around.
+            self._filled = True
+        self._last_count = end
+
+        start = end - self.ave_num
+        if start >= 0:
+            return self._buffer[start:end]
+        if not self._filled:
+            # The ring buffer may have wrapped around between two reads, which the
+            # sample counter alone can't tell; it's full once a round has elapsed.
+            elapsed = time.monotonic() - self._started
+            self._filled = elapsed >= self.smpl_num / self.smpl_freq
+        if not self._filled:
+            # Right after the sampling started, the tail of the ring buffer is not
+            # filled yet. Don't average the zero-initialized slots in.
+            return self._buffer[:end]
+        # Wrap around the ring buffer; same ordering as ``read_sampling_buffer``.
+        return np.concatenate((self._buffer[start:], self._buffer[:end]))
+
+    def _window(self) -> np.ndarray:
+        """Same as ``_read_buffer``, but discards the averages if new samples came."""
+        now = time.monotonic()
+        buf = self._read_buffer()
+        # Unchanged sample counter means no new sample, unless the ring buffer made
+        # one full round in between.
+        if (self._last_count != self._cache_count) or (
+            now - self._cache_time >= self.smpl_num / self.smpl_freq
+        ):
+            self._clear_cache()
+            self._cache_count = self._last_count
+            self._cache_time = now
+        return buf
+
+    @staticmethod
+    def _average(samples: np.ndarray) -> np.ndarray:
+        if len(samples) == 0:
+            # Nothing is sampled yet.
+            return np.full(samples.shape[1:], np.nan)[()]
+        return samples.mean(axis=0, dtype=np.float64)
+
+    def get_all_values(self) -> np.ndarray:
+        """Averaged voltage of all channels, indexed by zero-based channel number."""
+        with self._lock:
+            buf = self._window()
+            if self._mean_all is None:
+                self._mean_all = self._average(buf)
+            return self._mean_all
+
+    def _get_value(self, idx: int) -> float:
+        """Averaged voltage of a channel, given zero-based channel number."""
+        with self._lock:
+            buf = self._window()
+            if self._mean_all is not None:
+                return self._mean_all[idx]
+            if idx not in self._mean_ch:
+                self._mean_ch[idx] = self._average(buf[:, idx])
+            return self._mean_ch[idx]
+
     def get_data(self) -> List[float]:
-        with busy(self, "busy"):
-            offset = self.ad.get_status()["smpl_count"] - self.ave_num
-            data = self.ad.read_sampling_buffer(self.ave_num, offset)
-            data_li_2 = []
-            for i in range(self.all_ch_num):
-                data_li = []
-                for k in range(self.ave_num):
-                    data_li.append(data[k][i])
-                data_li_2.append(data_li)
-
-            ave_data_li = []
-            for data in data_li_2:
-                d = sum(data) / self.ave_num
-                ave_data_li.append(d)
-            return ave_data_li
+        return self.get_all_values().tolist()
 
     @property
-    def converter(self) -> Dict[str, Callable[[float], float]]:
-        conv = []
-        for i in self.Config.converter:
-            _ = [sanitize(expr, "x") for k, expr in i.items() if k == "func"]
-            conv.append(
-                {k: v if k != "func" else eval(f"lambda x: {v}") for k, v in i.items()}
+    def converter(self) -> List[Dict[str, Any]]:
+        if self._converter is None:
+            conv = []
+            for i in self.Config.converter:
+                parsed = dict(i)
+                if "func" in parsed:
+                    parsed["func"] = lambdify(parsed["func"], "x")
+                conv.append(parsed)
+            # Converters are pure arithmetic of ``x``, so they also apply element-wise
+            # to ``np.ndarray`` inputs.
+            self._converter = conv
+            # Keep the first definition for each channel, as the linear search did.
+            for c in reversed(conv):
+                self._conv_by_ch[c["ch"]] = c
+        return self._converter
+
+    def _converters_for(self, target: str) -> List[Dict[str, Any]]:
+        if target not in self._conv_by_target:
+            conv = [i for i in self.converter if i["ch"].startswith(target)]
+            self._conv_by_target[target] = conv
+            self._cols_by_target[target] = np.array(
+                [self._ch0[i["ch"]] for i in conv], dtype=np.intp
             )
-        return conv
+            # Parse the unit strings here, not on every Quantity construction.
+            self._units_by_target[target] = [u.Unit(i["units"]) for i in conv]
+        return self._conv_by_target[target]
+
+    def _get_values(self, cols: np.ndarray) -> np.ndarray:
+        """Averaged voltage of channels, given zero-based channel numbers."""
+        with self._lock:
+            buf = self._window()
+            if self._mean_all is not None:
+                return self._mean_all[cols]
+        return self._average(buf[:, cols])
 
     def get_all(self, target: str) -> dict:
-        data = self.get_data()
+        conv = self._converters_for(target)
+        # Average only the columns of this target, in a single pass.
+        data = self._get_values(self._cols_by_target[target]).tolist()
+        units = self._units_by_target[target]
         data_dict = {}
-        filtered_conv = list(
-            filter(lambda item: item["ch"].startswith(target), self.converter)
-        )
-        for i in filtered_conv:
-            ch = self.Config.channel[i["ch"]]
-            value = i["func"](data[ch - 1])
-            data_dict[i["ch"]] = u.Quantity(value, i["units"])
+        for i, unit, value in zip(conv, units, data):
+            data_dict[i["ch"]] = u.Quantity(i["func"](value), unit, copy=False)
         return data_dict
 
     def get_from_id(self, id: str) -> u.Quantity:
-        ch = self.Config.channel[id]
-        li_search = list(filter(lambda item: item["ch"] == id, self.converter))[0]
-        value = li_search["func"](self.get_data()[ch - 1])
-        return u.Quantity(value, li_search["units"])
+        idx = self._ch0[id]
+        _ = self.converter  # Ensure the lookup table is built.
+        conv = self._conv_by_ch[id]
+        if id not in self._unit_by_ch:
+            self._unit_by_ch[id] = u.Unit(conv["units"])
+        value = conv["func"](self._get_value(idx))
+        return u.Quantity(value, self._unit_by_ch[id], copy=False)
 
     def finalize(self) -> None:
         self.ad.stop_sampling()
+        with self._lock:
+            self._clear_cache()
 
     def close(self) -> None:
         self.finalize()
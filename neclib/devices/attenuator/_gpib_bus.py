@@ -0,0 +1,157 @@
+import atexit
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, ClassVar, Dict, Optional, Tuple
+
+import ogameasure
+
+
+class _SharedPrologix(ogameasure.gpib_prologix):
+    """GPIB communicator for single address, on the socket owned by ``GPIBBus``."""
+
+    def __init__(self, bus: "GPIBBus", gpibport: int) -> None:
+        super().__init__(bus.com, gpibport)
+        self.bus = bus
+        self._released = False
+        self._lock = threading.Lock()
+
+    def close(self) -> None:
+        # The socket is shared with other devices on the bus; just detach from it.
+        # Detach only once, even if the device is closed more than once.
+        with self._lock:
+            if self._released:
+                return
+            self._released = True
+        self.bus.release()
+
+
+class GPIBDeviceProxy:
+    """Forward method calls of an ``ogameasure`` device to the bus thread."""
+
+    def __init__(self, bus: "GPIBBus", device: Any) -> None:
+        self._bus = bus
+        self._device = device
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._device, name)
+        if not callable(attr):
+            return attr
+
+        def method(*args: Any, **kwargs: Any) -> Any:
+            return self._bus.call(attr, *args, **kwargs)
+
+        # Cache the wrapper, so that ``__getattr__`` is not called again for it.
+        self.__dict__[name] = method
+        return method
+
+
+class GPIBBus(threading.Thread):
+    """Single connection to a GPIB-LAN (Prologix) adapter, shared by all devices.
+
+    Each adapter is driven by one thread, which executes the commands from all
+    devices on the bus one by one, so that the write-read cycles of different devices
+    never interleave on the wire.
+
+    Examples
+    --------
+    >>> bus = GPIBBus.get("192.168.100.10")
+    >>> io = bus.proxy(28, ogameasure.Agilent.agilent_11713B)
+    >>> io.att_level_query("X")
+    10.0
+
+    """
+
+    _instances: ClassVar[Dict[Tuple[str, int], "GPIBBus"]] = {}
+    _instances_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, host: str, port: int = 1234, timeout: float = 10) -> None:
+        super().__init__(name=f"GPIBBus-{host}:{port}", daemon=True)
+        self.key = (host, port)
+        self.com = ogameasure.ethernet(host, port, timeout)
+        self.timeout = timeout
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._n_users = 0
+        self._stopped = False
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get(cls, host: str, port: int = 1234) -> "GPIBBus":
+        """Return the bus for the adapter, starting it if not running yet."""
+        with cls._instances_lock:
+            if (host, port) not in cls._instances:
+                bus = cls(host, port)
+                bus.start()
+                cls._instances[(host, port)] = bus
+            bus = cls._instances[(host, port)]
+            bus._n_users += 1
+            return bus
+
+    def run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            future, func, args, kwargs = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(func(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+        if self.com.connection:
+            self.com.close()
+
+    def call(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Execute ``func`` on the bus thread and wait for the result."""
+        future: Future = Future()
+        with self._lock:
+            if self._stopped:
+                raise RuntimeError(f"GPIB bus {self.key} is already closed.")
+            self._queue.put((future, func, args, kwargs))
+        return future.result()
+
+    def proxy(self, gpibport: int, device: Callable[[Any], Any]) -> GPIBDeviceProxy:
+        """Create ``ogameasure`` device at GPIB address ``gpibport`` on this bus."""
+        com = _SharedPrologix(self, gpibport)
+        try:
+            return GPIBDeviceProxy(self, self.call(device, com))
+        except Exception:
+            self.release()
+            raise
+
+    def release(self) -> None:
+        """Detach a device from the bus, closing the connection after the last."""
+        with self._instances_lock:
+            self._n_users -= 1
+            if self._n_users > 0:
+                return
+            self._instances.pop(self.key, None)
+        self._finish()
+
+    def _finish(self) -> None:
+        with self._lock:
+            if self._stopped:
+                return
+            # Commands queued so far are still executed before the thread exits.
+            self._stopped = True
+            self._queue.put(None)
+
+    def shutdown(self, timeout: Optional[float] = None) -> None:
+        """Stop accepting commands, and wait for the queued ones to be executed."""
+        self._finish()
+        self.join(timeout)
+
+    @classmethod
+    def shutdown_all(cls) -> None:
+        """Shut down all buses, e.g. on interpreter exit."""
+        with cls._instances_lock:
+            buses = list(cls._instances.values())
+            cls._instances.clear()
+        for bus in buses:
+            bus.shutdown(bus.timeout)
+
+
+# The bus threads are daemonic, so they are killed on interpreter exit together with
+# the commands left in their queues, unless drained here.
+atexit.register(GPIBBus.shutdown_all)
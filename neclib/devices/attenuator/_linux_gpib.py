@@ -0,0 +1,52 @@
+from ogameasure.communicator.communicator import communicator
+
+try:
+    import gpib
+except ImportError:  # linux-gpib is optional.
+    gpib = None
+
+
+class LinuxGPIB(communicator):
+    """Communicator over local GPIB interface board, driven by linux-gpib.
+
+    Exposes the same ``send`` / ``readline`` interface as ``ogameasure``
+    communicators, so it can be passed to ``ogameasure`` device classes.
+
+    Parameters
+    ----------
+    board
+        Minor number of the GPIB interface board, i.e. ``/dev/gpib<board>``.
+    address
+        GPIB primary address of the device.
+
+    """
+
+    method = "linux_gpib"
+
+    def __init__(self, board: int, address: int) -> None:
+        if gpib is None:
+            raise ModuleNotFoundError("No module named 'gpib'")
+        self.board = int(board)
+        self.address = int(address)
+        self.ud = None
+
+    def open(self) -> None:
+        if self.ud is None:
+            self.ud = gpib.dev(self.board, self.address)
+            self.connection = True
+
+    def close(self) -> None:
+        if self.ud is not None:
+            gpib.close(self.ud)
+            self.ud = None
+            self.connection = False
+
+    def send(self, msg: str) -> None:
+        gpib.write(self.ud, (msg + self.terminator).encode())
+
+    def recv(self, byte: int = 1024) -> bytes:
+        return gpib.read(self.ud, byte)
+
+    def readline(self) -> str:
+        # Read the whole response up to EOI in one call, instead of byte-by-byte.
+        return gpib.read(self.ud, 1024).decode()
@@ -1,9 +1,14 @@
+import threading
+import time
+from typing import Dict, Iterable, Optional, Set, Tuple
+
 import astropy.units as u
 import ogameasure
 
 from ... import get_logger
-from ...core.security import busy
 from ...utils import skip_on_simulator
+from ._gpib_bus import GPIBBus
+from ._linux_gpib import LinuxGPIB
 from .attenuator_base import NetworkAttenuator
 
 
@@ -16,7 +21,9 @@ class A11713B(NetworkAttenuator):
     Configuration items for this device:
 
     communicator : str
-        Communicator of thermometer. GPIB or LAN can be chosen.
+        Communicator of thermometer. GPIB, GPIB_DIRECT or LAN can be chosen.
+        GPIB_DIRECT talks to a local GPIB interface board via linux-gpib, and falls
+        back to GPIB (Prologix) if linux-gpib is not installed.
 
     host : str
         IP address for GPIB and ethernet communicator.
@@ -25,6 +32,10 @@ class A11713B(NetworkAttenuator):
         GPIB port of using devices. Please check device setting.
         If you use GPIB communicator, you must set this parameter.
 
+    gpib_board : int
+        Minor number of local GPIB interface board, i.e. ``/dev/gpib<gpib_board>``.
+        If you use GPIB_DIRECT communicator, you must set this parameter.
+
     lan_port : int
         LAN port of using devices. This parameter is setted to 5025 by manufacturer.
         If you use LAN communicator, you must set this parameter.
@@ -46,6 +57,17 @@ class A11713B(NetworkAttenuator):
         channels up to two channels: "X", "Y".
         For example: `{ 2R = "X", 2L = "Y"}`
 
+    skip_unchanged : bool
+        Optional. If true, ``set_loss`` does not write an attenuation equal to the one
+        this process last wrote to the channel. Changes made outside this process
+        (front panel, other clients, power cycle) are not noticed then, so default is
+        false.
+
+    get_ttl_sec : float
+        Optional. Duration in seconds for which the attenuation read by ``get_loss``
+        is reused, to reduce queries to the device under frequent polling. Default is
+        0, i.e. always query the device.
+
     """
 
     Manufacturer = "Agilent"
@@ -57,24 +79,59 @@ class A11713B(NetworkAttenuator):
     def __init__(self) -> None:
         self.logger = get_logger(self.__class__.__name__)
 
+        Device = ogameasure.Agilent.agilent_11713B
         if self.Config.communicator == "GPIB":
-            com = ogameasure.gpib_prologix(self.Config.host, self.Config.gpib_port)
+            bus = GPIBBus.get(self.Config.host)
+            self.io = bus.proxy(self.Config.gpib_port, Device)
+        elif self.Config.communicator == "GPIB_DIRECT":
+            try:
+                self.io = Device(
+                    LinuxGPIB(self.Config.gpib_board, self.Config.gpib_port)
+                )
+            except ModuleNotFoundError:
+                self.logger.warning(
+                    "linux-gpib is not installed, falling back to GPIB (Prologix)."
+                )
+                bus = GPIBBus.get(self.Config.host)
+                self.io = bus.proxy(self.Config.gpib_port, Device)
         elif self.Config.communicator == "LAN":
             com = ogameasure.ethernet(self.Config.host, self.Config.lan_port)
+            self.io = Device(com)
         else:
             self.logger.warning(
                 f"There is not exsited communicator: {self.Config.communicator}."
                 "Please choose USB or GPIB."
             )
-        self.io = ogameasure.Agilent.agilent_11713B(com)
-        self.model_check()
-        pass
-
-    def model_check(self) -> None:
-        for id in self.Config.model.keys():
-            ch = self.Config.channel[id]
-            model = self.Config.model[id]
-            dev_model = self.io.att_model_query(ch)
+        self._ch = dict(self.Config.channel)
+        # Attenuation last written to each channel by this process.
+        self._last_set: Dict[str, float] = {}
+        self._skip_unchanged = getattr(self.Config, "skip_unchanged", False)
+        self._get_cache: Dict[str, Tuple[float, float]] = {}
+        self._get_ttl = getattr(self.Config, "get_ttl_sec", 0)
+        self._lock = threading.Lock()
+        # Channels are verified against ``model`` on their first use.
+        self._verified: Set[str] = set()
+
+    def _bulk_model_query(self, ids: Iterable[str]) -> Dict[str, str]:
+        """Query model of each channel in use, once per physical channel."""
+        channels = {self._ch[id] for id in ids}
+        return {ch: self.io.att_model_query(ch) for ch in sorted(channels)}
+
+    def model_check(self, ids: Optional[Iterable[str]] = None) -> None:
+        """Check the attenuator models against the configuration.
+
+        Parameters
+        ----------
+        ids
+            Channel names to check. If omitted, all channels in ``model`` are checked.
+
+        """
+        ids = set(self.Config.model.keys() if ids is None else ids)
+        models = {id: m for id, m in self.Config.model.items() if id in ids}
+        dev_models = self._bulk_model_query(models.keys())
+        for id, model in models.items():
+            ch = self._ch[id]
+            dev_model = dev_models[ch]
             if model != "AG8495k":
                 _model = model[:-1]
             else:
@@ -85,20 +142,35 @@ class A11713B(NetworkAttenuator):
                     f"the model which you set in device. {id}: {ch}, {model}"
                 )
             pass
+        self._verified.update(ids)
 
     def get_loss(self, id: str) -> u.Quantity:
-        with busy(self, "busy"):
-            ch = self.Config.channel[id]
+        with self._lock:
+            ch = self._ch[id]
+            if id not in self._verified:
+                self.model_check([id])
+            now = time.monotonic()
+            cached = self._get_cache.get(ch)
+            if (cached is not None) and (now - cached[0] < self._get_ttl):
+                return u.Quantity(cached[1], u.dB)
             try:
-                return self.io.att_level_query(ch) * u.dB
-            except IndexError:
-                pass
-            raise ValueError(f"Invalid channel: {ch}")
+                loss = self.io.att_level_query(ch)
+            except IndexError as e:
+                raise ValueError(f"Invalid channel: {ch}") from e
+            if self._get_ttl > 0:
+                self._get_cache[ch] = (now, loss)
+            return u.Quantity(loss, u.dB)
 
     def set_loss(self, dB: int, id: str) -> None:
-        with busy(self, "busy"):
-            ch = self.Config.channel[id]
+        with self._lock:
+            ch = self._ch[id]
+            if id not in self._verified:
+                self.model_check([id])
+            if self._skip_unchanged and (self._last_set.get(ch) == dB):
+                return
+            self._get_cache.pop(ch, None)
             self.io.att_level_set(dB, ch)
+            self._last_set[ch] = dB
 
     def finalize(self) -> None:
         self.io.com.close()
@@ -1,4 +1,4 @@
-import time
+from typing import Dict, Tuple
 
 from ...core.security import busy
 from .attenuator_base import CurrentAttenuator
@@ -38,49 +38,57 @@ class CPZ340516(CurrentAttenuator):
 
     Identifier = "rsw_id"
 
+    _ZeroCurrent: Tuple[Tuple[int, float], ...] = tuple((i, 0.0) for i in range(1, 9))
+
     def __init__(self):
         import pyinterface
 
         self.rsw_id = self.Config.rsw_id
         self.range = self.Config.range
         self.channel = self.Config.channel
-        self.param_buff = {i: 0.0 for i in range(1, 9)}  # All in [mA]
+        self._ch = dict(self.channel)
+        self.param_buff = dict(self._ZeroCurrent)  # All in [mA]
+        self._last_applied: Dict[int, float] = {}
         self.io = pyinterface.open(3405, self.rsw_id)
         for i in self.channel.values():
             try:
                 self.io.set_outputrange(i, self.range)
             except Exception as e:
-                if e == "lspci: Unable to load libkmod resources: error -2":
-                    pass
-                else:
-                    raise ValueError(f"Invalid channel: {i}")
+                raise ValueError(f"Invalid channel: {i}") from e
 
     def get_outputrange(self, id: int) -> dict:
-        ch = self.Config.channel[id]
+        ch = self._ch[id]
         with busy(self, "busy"):
             return self.io.get_outputrange(ch)
 
     def set_current(self, mA: float, id: str) -> None:
-        ch = self.Config.channel[id]
+        ch = self._ch[id]
         if ch not in self.param_buff.keys():
             raise ValueError(f"Invaild channel {ch}")
         else:
             self.param_buff[ch] = mA
 
     def set_outputrange(self, id: int, outputrange: str) -> None:
-        self.io.set_outputrange(id, outputrange)
+        try:
+            self.io.set_outputrange(id, outputrange)
+        except IndexError as e:
+            raise ValueError(f"Invalid channel: {id}") from e
+        # Output current is converted using the range, so it has to be written again.
+        self._last_applied.pop(id, None)
 
     def apply_current(self) -> None:
         with busy(self, "busy"):
-            for i in range(0, 8):
-                ch = int(list(self.param_buff.keys())[i])
-                current = list(self.param_buff.values())[i]
+            for ch, current in self.param_buff.items():
+                # The board keeps the output until next write; skip unchanged channels.
+                if self._last_applied.get(ch) == current:
+                    continue
                 self.io.output_current(ch, current)
-                time.sleep(0.001)
+                self._last_applied[ch] = current
 
     def finalize(self) -> None:
         self.io.finalize()
-        self.param_buff = {i: 0.0 for i in range(1, 9)}
+        self.param_buff = dict(self._ZeroCurrent)
+        self._last_applied = {}
 
     def close(self) -> None:
         pass
@@ -1,8 +1,11 @@
+import threading
+import time
+from typing import Dict, Tuple
+
 import astropy.units as u
 import ogameasure
 
 from ... import utils
-from ...core.security import busy
 from .attenuator_base import NetworkAttenuator
 
 
@@ -26,6 +29,17 @@ class RHIO10(NetworkAttenuator):
         device level identifier (int). You can assign any name to the
         channels up to two channels. For example: `{ CH1 = 1, CH2 = 2}`
 
+    skip_unchanged : bool
+        Optional. If true, ``set_loss`` does not write an attenuation equal to the one
+        this process last wrote to the channel. Changes made outside this process
+        (front panel, other clients, power cycle) are not noticed then, so default is
+        false.
+
+    get_ttl_sec : float
+        Optional. Duration in seconds for which the attenuation read by ``get_loss``
+        is reused, to reduce queries to the device under frequent polling. Default is
+        0, i.e. always query the device.
+
     """
 
     Manufacturer: str = "SENA"
@@ -37,23 +51,40 @@ class RHIO10(NetworkAttenuator):
     def __init__(self) -> None:
         com = ogameasure.ethernet(self.Config.host, self.Config.port)
         self.io = ogameasure.SENA.adios(com)
+        self._ch = dict(self.Config.channel)
+        self._getters = {1: self.io.get_att1, 2: self.io.get_att2}
+        # Attenuation last written to each channel by this process.
+        self._last_set: Dict[int, float] = {}
+        self._skip_unchanged = getattr(self.Config, "skip_unchanged", False)
+        self._get_cache: Dict[int, Tuple[float, float]] = {}
+        self._get_ttl = getattr(self.Config, "get_ttl_sec", 0)
+        self._lock = threading.Lock()
 
     def get_loss(self, id: str) -> u.Quantity:
-        with busy(self, "busy"):
-            ch = self.Config.channel[id]
+        with self._lock:
+            ch = self._ch[id]
+            now = time.monotonic()
+            cached = self._get_cache.get(ch)
+            if (cached is not None) and (now - cached[0] < self._get_ttl):
+                return u.Quantity(cached[1], u.dB)
+            if ch not in self._getters:
+                raise ValueError(f"Invalid channel: {ch}")
             try:
-                if ch == 1:
-                    return self.io.get_att1() << u.dB
-                elif ch == 2:
-                    return self.io.get_att2() << u.dB
-            except IndexError:
-                pass
-            raise ValueError(f"Invalid channel: {ch}")
+                loss = self._getters[ch]()
+            except IndexError as e:
+                raise ValueError(f"Invalid channel: {ch}") from e
+            if self._get_ttl > 0:
+                self._get_cache[ch] = (now, loss)
+            return u.Quantity(loss, u.dB)
 
     def set_loss(self, dB: int, id: str) -> None:
-        with busy(self, "busy"):
-            ch = self.Config.channel[id]
+        with self._lock:
+            ch = self._ch[id]
+            if self._skip_unchanged and (self._last_set.get(ch) == int(dB)):
+                return
+            self._get_cache.pop(ch, None)
             self.io._set_att(ch, int(dB))
+            self._last_set[ch] = int(dB)
 
     def finalize(self) -> None:
         self.io.com.close()
@@ -1,4 +1,4 @@
-from collections import defaultdict
+from typing import Dict
 
 import astropy.units as u
 
@@ -11,14 +11,16 @@ class NetworkAttenuatorSimulator(NetworkAttenuator):
     Identifier = ""
     is_simulator = True
 
+    _Zero = u.Quantity(0, u.dB)
+
     def __init__(self) -> None:
-        self.loss = defaultdict(lambda: 0)
+        self.loss: Dict[str, u.Quantity] = {}
 
     def set_loss(self, dB: int, id: str):
-        self.loss[id] = dB
+        self.loss[id] = u.Quantity(dB, u.dB)
 
     def get_loss(self, id: str) -> u.Quantity:
-        return self.loss[id] * u.dB
+        return self.loss.get(id, self._Zero).copy()
 
     def finalize(self) -> None:
         pass
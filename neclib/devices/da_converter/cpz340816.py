@@ -1,7 +1,6 @@
-import time
-from typing import Callable, Union
+from typing import Callable, Dict, Optional, Tuple, Union
 
-from ...core.security import busy, sanitize
+from ...core.security import busy, lambdify
 from .da_converter_base import DAConverter
 
 
@@ -45,41 +44,47 @@ class CPZ340816(DAConverter):
 
     Identifier = "rsw_id"
 
+    _ZeroVoltage: Tuple[Tuple[int, float], ...] = tuple((i, 0.0) for i in range(1, 17))
+
     def __init__(self):
         import pyinterface
 
         self.rsw_id = self.Config.rsw_id
-        self.param_buff = {i: 0.0 for i in range(1, 17)}  # All in [V]
+        self.param_buff = dict(self._ZeroVoltage)  # All in [V]
+        self._converter: Optional[Dict[str, Callable[[float], float]]] = None
+        self._ch = dict(self.Config.channel)
+        self._valid_ch = frozenset(self.param_buff)
+        self._mv_min, self._mv_max = self.Config.max_mv
         self.da = pyinterface.open(3408, self.rsw_id)
 
     @property
-    def converter(self) -> Callable[[Union[int, float]], float]:
-        conv = {}
-        for k, v in self.Config.converter.items():
-            _ = sanitize(v, "x")
-            conv[k] = eval(f"lambda x: {v}")
-        return conv
+    def converter(self) -> Dict[str, Callable[[Union[int, float]], float]]:
+        if self._converter is None:
+            self._converter = {
+                k: lambdify(v, "x") for k, v in self.Config.converter.items()
+            }
+        return self._converter
 
     def set_voltage(self, mV: float, id: str) -> None:
-        ch = self.Config.channel[id]
-        if ch not in self.param_buff.keys():
+        ch = self._ch[id]
+        if ch not in self._valid_ch:
             raise ValueError(f"Invaild channel {ch}")
-        if not self.Config.max_mv[0] < mV < self.Config.max_mv[1]:
+        if not self._mv_min < mV < self._mv_max:
             raise ValueError(f"Unsafe voltage {mV} mV")
         else:
             self.param_buff[ch] = self.converter[id](mV)
 
     def apply_voltage(self) -> None:
         with busy(self, "busy"):
-            for i in range(0, 16):
-                ch = int(list(self.param_buff.keys())[i])
-                voltage = list(self.param_buff.values())[i]
+            # ``output_da`` disables all outputs before each write, so every channel
+            # is written. It also waits for channel selection internally, so the
+            # writes need no extra pacing.
+            for ch, voltage in self.param_buff.items():
                 self.da.output_da(ch, voltage)
-                time.sleep(0.001)
 
     def finalize(self) -> None:
         self.da.finalize()
-        self.param_buff = {i: 0.0 for i in range(1, 17)}
+        self.param_buff = dict(self._ZeroVoltage)
 
     def close(self) -> None:
         pass
@@ -1,3 +1,4 @@
+import functools
 from abc import ABC, abstractmethod
 from collections import UserDict
 from typing import (
@@ -15,16 +16,39 @@ from typing import (
     overload,
 )
 
-from .. import config, utils
+from .. import config, get_logger, utils
 from ..core import Parameters
 from ..core.configuration import Configuration
 from ..core.normalization import partial
 
+logger = get_logger(__name__)
+
 
 def get_device_configuration():
     return {k[:-2]: v for k, v in config.items() if k.endswith("._")}
 
 
+_model_index: Dict[str, List[str]] = {}
+_model_index_source: Any = None
+
+
+def _get_model_index() -> Dict[str, List[str]]:
+    """Names of the configured devices, grouped by normalized model name."""
+    global _model_index, _model_index_source
+    # ``config.reload()`` replaces the parameter table, so the cached index is valid as
+    # long as the same table object is in use.
+    if _model_index_source is not config._parameters:
+        index: Dict[str, List[str]] = {}
+        for k, v in get_device_configuration().items():
+            index.setdefault(DeviceBase._normalize(v), []).append(k)
+        _model_index, _model_index_source = index, config._parameters
+    return _model_index
+
+
+def _skip_init(*args, **kwargs) -> None:
+    """Replacement of ``__init__`` for already initialized singleton devices."""
+
+
 class DeviceBase(ABC):
 
     Model: ClassVar[str]
@@ -37,6 +61,7 @@ class DeviceBase(ABC):
     _instances: ClassVar[Dict[Any, "DeviceBase"]]
     _initialized: ClassVar[bool] = False
     _implementations: List[Type["DeviceBase"]] = []
+    _implementations_by_model: Dict[str, Type["DeviceBase"]] = {}
     _is_autogenerated: ClassVar[bool] = False
     _kind: ClassVar[Type["DeviceBase"]]
 
@@ -48,6 +73,7 @@ class DeviceBase(ABC):
             # grandchild classes, and not includes abstract classes (no `cls.Model` is
             # set).
             cls._implementations.append(cls)
+            cls._implementations_by_model[cls._normalize(cls.Model)] = cls
             if not hasattr(cls, "_instances"):
                 setattr(cls, "_instances", {})
         if cls.__base__ is DeviceBase:
@@ -65,8 +91,8 @@ class DeviceBase(ABC):
             cls._instances[identity] = inst
 
         # Initialization status check.
-        if cls._initialized:
-            cls.__init__ = lambda *args, **kwargs: None
+        if cls._initialized and (cls.__init__ is not _skip_init):
+            cls.__init__ = _skip_init
         cls._initialized = True
 
         return cls._instances[identity]
@@ -85,6 +111,7 @@ class DeviceBase(ABC):
         return simulator[0]
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def _normalize(key: str, /) -> str:
         return key.replace("_", "").lower()
 
@@ -94,14 +121,15 @@ class DeviceBase(ABC):
     ) -> Optional[Configuration]:
         this_device_config = config[name]
         model = cls._normalize(this_device_config._)  # type: ignore
+        model_filtered = _get_model_index().get(model, [])
+        if model_filtered == [name]:
+            # No other device of the same model to be merged.
+            return this_device_config
+
         identity = None
         if identifier is not None:
             identity = getattr(this_device_config, identifier, None)
 
-        device_configuration = get_device_configuration()
-        model_filtered = [
-            k for k, v in device_configuration.items() if cls._normalize(v) == model
-        ]
         _cfgs: List[Configuration] = [config[k] for k in model_filtered]  # type: ignore
         cfg = None
         for _cfg in _cfgs:
@@ -136,14 +164,13 @@ class DeviceBase(ABC):
     def bind(
         cls, name: str, model: Union[str, Dict[str, str]]
     ) -> Union[Type["DeviceBase"], "Devices[str, Type[DeviceBase]]"]:
-        impl = {cls._normalize(_impl.Model): _impl for _impl in cls._implementations}
         if isinstance(model, dict):
             bound_devices = {
                 key: cls.bind(f"{name}.{key}", _model) for key, _model in model.items()
             }
             return Devices(bound_devices)
         else:
-            model_impl = impl[cls._normalize(model)]
+            model_impl = cls._implementations_by_model[cls._normalize(model)]
             if config.simulator:
                 try:
                     simulator = model_impl.get_simulator_class()
@@ -217,7 +244,7 @@ class Devices(UserDict, Generic[T_key, T_value]):
 
     @property
     def _is_single_anonymous_device(self) -> bool:
-        return (len(self) == 1) and (list(self.keys())[0] is None)
+        return (len(self.data) == 1) and (None in self.data)
 
     def _parse_id_query(
         self, id: Optional[str] = None
@@ -247,20 +274,46 @@ class Devices(UserDict, Generic[T_key, T_value]):
         kwargs["id"] = channel_id
         return self[device_id](*args, **kwargs)
 
+    def _clear_cache(self) -> None:
+        self.__dict__["_attr_cache"] = {}
+        self.__dict__["_normalized"] = None
+
+    def __copy__(self) -> "Devices":
+        inst = super().__copy__()
+        # Cached methods refer to this instance, so the copy has to build its own.
+        inst._clear_cache()
+        return inst
+
+    def __setitem__(self, key: Union[str, None], value: Any, /) -> None:
+        self._clear_cache()
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: Union[str, None], /) -> None:
+        self._clear_cache()
+        super().__delitem__(key)
+
     def __getattr__(self, key: str, /) -> Any:
         """Emulate attribute access to attached device controllers."""
+        # Methods are resolved once per set of devices; other attributes may change, so
+        # they are looked up every time.
+        cache = self.__dict__.setdefault("_attr_cache", {})
+        if key in cache:
+            return cache[key]
+
         targets = {k: getattr(v, key) for k, v in self.items()}
         if all(callable(t) for t in targets.values()):
+            single_anonymous_device = self._is_single_anonymous_device
 
             def func(*args, **kwargs) -> Union[Any, Dict[Union[str, None], Any]]:
                 device_id, channel_id = self._parse_id_query(kwargs.get("id", None))
                 if (device_id is None) and (channel_id is None):
-                    if self._is_single_anonymous_device:
+                    if single_anonymous_device:
                         return targets[None](*args, **kwargs)
                     return {k: t(*args, **kwargs) for k, t in targets.items()}
                 kwargs["id"] = channel_id
                 return targets[device_id](*args, **kwargs)
 
+            cache[key] = func
             return func
 
         elif self._is_single_anonymous_device:
@@ -275,16 +328,21 @@ class Devices(UserDict, Generic[T_key, T_value]):
             pass
 
         if isinstance(key, str):
-            item_normalized = {
-                k.replace("_", "").lower() if isinstance(k, str) else k: v
-                for k, v in self.items()
-            }
+            item_normalized = self.__dict__.get("_normalized")
+            if item_normalized is None:
+                item_normalized = {
+                    k.replace("_", "").lower() if isinstance(k, str) else k: v
+                    for k, v in self.items()
+                }
+                self.__dict__["_normalized"] = item_normalized
             _key = key.replace("_", "").lower()
             if _key in item_normalized:
                 return item_normalized[_key]
 
             device_id, channel_id = self._parse_id_query(_key)
             if device_id in item_normalized:
+                # Methods of the item are replaced below.
+                self.__dict__["_attr_cache"] = {}
                 item = item_normalized[device_id]
                 for attr_name in dir(item):
                     attr = getattr(item, attr_name, None)
@@ -292,11 +350,10 @@ class Devices(UserDict, Generic[T_key, T_value]):
                         continue
                     try:
                         modified = partial(attr, kwargs={"id": channel_id})
-                        print(attr_name, modified)
                         object.__setattr__(item, attr_name, modified)
-                    except TypeError as e:
-                        print(attr_name, e)
+                    except TypeError:
                         continue
+                logger.debug(f"Methods of {device_id!r} are bound to {channel_id=}")
                 return item
 
             raise KeyError(channel_id)
@@ -1,5 +1,7 @@
 __all__ = ["CPZ6204"]
 
+from typing import Dict
+
 from astropy import units as u
 
 from ... import get_logger, utils
@@ -27,12 +29,15 @@ class CPZ6204(Encoder):
 
     Identifier = "rsw_id"
 
+    _HalfTurn = 1800.0 * 360  # [arcsec]
+
     def __init__(self) -> None:
         self.logger = get_logger(self.__class__.__name__)
         self.rsw_id = self.Config.rsw_id
         self.separation = self.Config.separation
 
         self.resolution = 360 * 3600 / (23600 * 400)
+        self._counts_to_deg = self.resolution / 3600
 
         if self.separation == "antenna":
             self.io = self._antenna_initialize()
@@ -104,17 +109,18 @@ class CPZ6204(Encoder):
             ((counter - self.dome_encoffset) * self.dome_enc2arcsec)
             - self.dome_enc_tel_offset
         )
-        while dome_enc_arcsec > 1800.0 * 360:
-            dome_enc_arcsec -= 3600.0 * 360
-        while dome_enc_arcsec <= -1800.0 * 360:
-            dome_enc_arcsec += 3600.0 * 360
+        # Wrap into (-180, 180] deg.
+        dome_enc_arcsec = self._HalfTurn - (self._HalfTurn - dome_enc_arcsec) % (
+            2 * self._HalfTurn
+        )
         dome_position = dome_enc_arcsec / 3600
-        self.dome_position = dome_position * u.deg
+        self.dome_position = u.Quantity(dome_position, u.deg, copy=False)
         return self.dome_position
 
-    def get_reading(self):
-        cntAz = int(self.io.get_counter(unsigned=False, ch=1))
-        cntEl = int(self.io.get_counter(unsigned=False, ch=2))
+    def get_reading(self) -> Dict[str, u.Quantity]:
+        get_counter = self.io.get_counter
+        cntAz = int(get_counter(unsigned=False, ch=1))
+        cntEl = int(get_counter(unsigned=False, ch=2))
         """unsigned
         if cntAz < 360*3600./self.resolution:
             #encAz = (324*cntAz+295)/590
@@ -123,9 +129,6 @@ class CPZ6204(Encoder):
             encAz = -(2**32-cntAz)*self.resolution
             pass
         """
-        encAz = cntAz * self.resolution
-        Az = encAz / 3600
-        Az = Az * u.deg
 
         """ unsigned
         if cntEl < 360*3600./self.resolution:
@@ -135,12 +138,11 @@ class CPZ6204(Encoder):
             encEl = -(2**32-cntEl)*self.resolution
             pass
         """
-        encEl = cntEl * self.resolution
-        _El = (encEl / 3600) + self.el_adjust
-        El = _El * u.deg
-        AzEl = {"az": Az, "el": El}
-
-        return AzEl  # , _utc]
+        counts_to_deg = self._counts_to_deg
+        return {
+            "az": u.Quantity(cntAz * counts_to_deg, u.deg, copy=False),
+            "el": u.Quantity(cntEl * counts_to_deg + self.el_adjust, u.deg, copy=False),
+        }
 
     def dome_set_counter(self, limit):
         # self.dio.ctrl.set_counter(counter)
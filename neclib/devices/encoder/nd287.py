@@ -33,7 +33,8 @@ class ND287(Encoder):
     def get_reading(self) -> u.Quantity:
         with busy(self, "busy"):
             raw = self.io.output_position_display_value()
-        return float(raw.strip(b"\x02\x00\r\n").decode()) << u.deg  # type: ignore
+        value = float(raw.strip(b"\x02\x00\r\n"))
+        return u.Quantity(value, u.deg, copy=False)
 
     def finalize(self) -> None:
         try:
@@ -30,10 +30,27 @@ class CPZ2724(Motor):
 
     Identifier = "rsw_id"
 
+    _DomePosition = {(1, 0): "OPEN", (0, 1): "CLOSE"}
+    _MembPosition = {(0, 0): "POSE", (1, 0): "OPEN", (0, 1): "CLOSE"}
+    _Int16 = struct.Struct("<h")
+    # Bits of each byte value, least significant first.
+    _Bits = tuple(tuple((b >> i) & 1 for i in range(8)) for b in range(256))
+
     def __init__(self) -> None:
         self.logger = get_logger(self.__class__.__name__)
         self.rsw_id = self.Config.rsw_id
 
+        # Each role of this board (antenna, dome, membrane, M2, drive) has its own
+        # subset of configuration items.
+        self.max_rate = getattr(self.Config, "max_rate", None)
+        self.pulse_rate = getattr(self.Config, "pulse_rate", None)
+        self.cw = getattr(self.Config, "cw", None)
+        self.ccw = getattr(self.Config, "ccw", None)
+        self.motor_speed = getattr(self.Config, "motor_speed", None)
+        self._position = getattr(self.Config, "position", None)
+        self._drive_pos = getattr(self.Config, "drive_pos", None)
+        self._contactor_pos = getattr(self.Config, "contactor_pos", None)
+
         self.speed_to_rate = float((7 / 12) * 10000)
 
         self.io = self._initialize_io()
@@ -57,7 +74,6 @@ class CPZ2724(Motor):
         speed: float,
         axis: str,
     ):
-        self.max_rate = self.Config.max_rate
         speed_float = float(speed) * self.speed_to_rate
 
         if speed_float > self.max_rate:
@@ -77,8 +93,7 @@ class CPZ2724(Motor):
         else:
             raise ValueError(f"No valid axis : {axis}")
         status = self.io.input_word(word)
-        status_int = struct.unpack("<h", status.bytes)
-        (speed,) = status_int
+        (speed,) = self._Int16.unpack(status.bytes)
         speed_deg = speed / 3600
         return speed_deg * u.deg / u.s
 
@@ -91,11 +106,8 @@ class CPZ2724(Motor):
         else:
             raise ValueError(f"No valid axis : {axis}")
 
-        cmd = list(
-            map(
-                int, "".join([format(b, "08b")[::-1] for b in struct.pack("<h", speed)])
-            )
-        )  # [::-1] for little endian.
+        lo, hi = self._Int16.pack(speed)
+        cmd = list(self._Bits[lo] + self._Bits[hi])
         self.io.output_word(word, cmd)
 
     def antenna_stop(self):
@@ -144,7 +156,7 @@ class CPZ2724(Motor):
         # posにはopen or close を入れる
         ret = self.dome_status()
         if (ret[1].lower() != pos) & (ret[3].lower() != pos):
-            buff = self.Config.position[pos.lower()]
+            buff = self._position[pos.lower()]
             self.io.output_point(buff, 5)
         return
 
@@ -175,57 +187,22 @@ class CPZ2724(Motor):
             self.right_pos = "MOVE"
         else:
             self.right_act = "OFF"
-            if (ret[1] == 1) & (ret[2] == 0):
-                self.right_pos = "OPEN"
-            elif (ret[1] == 0) & (ret[2] == 1):
-                self.right_pos = "CLOSE"
-            else:
-                self.right_pos = "POSE"
+            self.right_pos = self._DomePosition.get((ret[1], ret[2]), "POSE")
 
         if ret[3] == 1:
             self.left_act = "DRIVE"
             self.left_pos = "MOVE"
         else:
             self.left_act = "OFF"
-            if (ret[4] == 1) & (ret[5] == 0):
-                self.left_pos = "OPEN"
-            elif (ret[4] == 0) & (ret[5] == 1):
-                self.left_pos = "CLOSE"
-            else:
-                self.left_pos = "POSE"
+            self.left_pos = self._DomePosition.get((ret[4], ret[5]), "POSE")
 
         return [self.right_act, self.right_pos, self.left_act, self.left_pos]
 
     def dome_limit_check(self):
         limit = self.io.input_point(12, 4)
-        ret = 0
-        if limit[0:4] == [0, 0, 0, 0]:
-            ret = 0
-        elif limit[0:4] == [1, 0, 0, 0]:
-            ret = 1
-        elif limit[0:4] == [0, 1, 0, 0]:
-            ret = 2
-        elif limit[0:4] == [1, 1, 0, 0]:
-            ret = 3
-        elif limit[0:4] == [0, 0, 1, 0]:
-            ret = 4
-        elif limit[0:4] == [1, 0, 1, 0]:
-            ret = 5
-        elif limit[0:4] == [0, 1, 1, 0]:
-            ret = 6
-        elif limit[0:4] == [1, 1, 1, 0]:
-            ret = 7
-        elif limit[0:4] == [0, 0, 0, 1]:
-            ret = 8
-        elif limit[0:4] == [1, 0, 0, 1]:
-            ret = 9
-        elif limit[0:4] == [0, 1, 0, 1]:
-            ret = 10
-        elif limit[0:4] == [1, 1, 0, 1]:
-            ret = 11
-        elif limit[0:4] == [0, 0, 1, 1]:
-            ret = 12
-        return ret
+        # Limit switch number is encoded in binary, least significant bit first.
+        ret = limit[0] | (limit[1] << 1) | (limit[2] << 2) | (limit[3] << 3)
+        return ret if ret <= 12 else 0
 
     # Membrane Control
 
@@ -233,7 +210,7 @@ class CPZ2724(Motor):
         # posには open or close を入れる
         ret = self.memb_status()
         if ret[1].lower() != pos:
-            buff = self.Config.position[pos.lower()]
+            buff = self._position[pos.lower()]
             self.io.output_point(buff, 7)
         return
 
@@ -246,12 +223,10 @@ class CPZ2724(Motor):
         ret = self.io.input_point(8, 3)
         if ret[0] == 0:
             self.memb_act = "OFF"
-            if (ret[1] == 0) & (ret[2] == 0):
-                self.memb_pos = "POSE"
-            elif (ret[1] == 1) & (ret[2] == 0):
-                self.memb_pos = "OPEN"
-            elif (ret[1] == 0) & (ret[2] == 1):
-                self.memb_pos = "CLOSE"
+            # Any other bit pattern leaves the last known position as is.
+            self.memb_pos = self._MembPosition.get(
+                (ret[1], ret[2]), getattr(self, "memb_pos", None)
+            )
         else:
             self.memb_act = "DRIVE"
             self.memb_pos = "MOVE"
@@ -267,8 +242,6 @@ class CPZ2724(Motor):
         self.MoveIndexFF(puls)
 
     def m2_status(self) -> list:
-        buff = []
-        buff2 = []
         in1_8 = self.io.input_byte("IN1_8").to_list()
         in9_16 = self.io.input_byte("IN9_16").to_list()
 
@@ -281,53 +254,18 @@ class CPZ2724(Motor):
         else:
             m_limit_down = 0
 
-        for i in range(8):
-            if i != 0 and in1_8 == [0, 0, 0, 0, 0, 0, 0, 0]:
-                buff.append(0)
-            if in1_8[i] == 0:
-                buff.append(0)
-            else:
-                buff.append(1)
+        byte1 = sum(1 << i for i in range(8) if in1_8[i] != 0)
+        byte2 = sum(1 << i for i in range(8) if in9_16[i] != 0)
 
-        for i in range(8):
-            if i != 0 and in9_16 == [0, 0, 0, 0, 0, 0, 0, 0]:
-                buff2.append(0)
-            if in9_16[i] == 0:
-                buff2.append(0)
-            else:
-                buff2.append(1)
-
-        # calculate each digit
-        total = (
-            buff[0] * 1
-            + buff[1] * 2
-            + buff[2] * pow(2.0, 2.0)
-            + buff[3] * pow(2.0, 3.0)
-        ) / 100.0
-        total = (
-            total
-            + (
-                buff[4] * 1
-                + buff[5] * 2
-                + buff[6] * pow(2.0, 2.0)
-                + buff[7] * pow(2.0, 3.0)
-            )
-            / 10.0
-        )
-        total2 = (
-            buff2[0] * 1
-            + buff2[1] * 2
-            + buff2[2] * pow(2.0, 2.0)
-            + buff2[3] * pow(2.0, 3.0)
-        )
-        total2 = total2 + (buff2[4] * 1) * 10
-
-        m_pos = (total + total2) * pow(-1.0, (buff2[5] + 1))
+        # calculate each digit, 4 bits each
+        total = (byte1 & 0xF) / 100.0 + (byte1 >> 4) / 10.0
+        total2 = (byte2 & 0xF) + ((byte2 >> 4) & 1) * 10
+
+        sign = 1.0 if (byte2 >> 5) & 1 else -1.0
+        m_pos = (total + total2) * sign
         return [m_pos, m_limit_up, m_limit_down]
 
     def um_to_puls(self, dist: int, status: list[int]) -> int:
-        self.pulse_rate = self.Config.pulse_rate
-
         puls = int(dist) * self.pulse_rate
         if (
             dist / 1000.0 + float(status[0]) <= -4.0
@@ -344,10 +282,6 @@ class CPZ2724(Motor):
         return puls
 
     def MoveIndexFF(self, puls: int):
-        self.cw = self.Config.cw
-        self.ccw = self.Config.ccw
-        self.motor_speed = self.Config.motor_speed
-
         if puls >= -65535 and puls <= 65535:
             # index mode
             self.io.output_byte("OUT1_8", [0, 0, 0, 1, 0, 0, 0, 0])
@@ -368,9 +302,10 @@ class CPZ2724(Motor):
             # displacement
             self.io.output_byte("OUT1_8", [0, 0, 0, 0, 0, 0, 0, 0])
             self.Strobe()
-            self.io.output_byte("OUT1_8", int(abs(puls) / 256), fmt="<I")
+            displacement = int(abs(puls))
+            self.io.output_byte("OUT1_8", displacement >> 8, fmt="<I")
             self.Strobe()
-            self.io.output_byte("OUT1_8", int(abs(puls) % 256), fmt="<I")
+            self.io.output_byte("OUT1_8", displacement & 0xFF, fmt="<I")
             self.Strobe()
             # start
             self.io.output_byte("OUT1_8", [0, 0, 0, 1, 1, 0, 0, 0])
@@ -394,13 +329,13 @@ class CPZ2724(Motor):
     # Drive Control
     def drive_move(self, pos) -> None:
         # pos = "on" or "off"
-        buff = self.Config.drive_pos[pos.lower()]
+        buff = self._drive_pos[pos.lower()]
         self.io.output_point(buff, 1)
         return
 
     def contactor_move(self, pos) -> None:
         # pos = "on" or "off"
-        buff = self.Config.contactor_pos[pos.lower()]
+        buff = self._contactor_pos[pos.lower()]
         self.io.output_point(buff, 9)
         return
 
@@ -6,9 +6,18 @@ from .device_base import DeviceBase, Devices
 
 logger = get_logger(__name__)
 
+_device_list: Dict[str, Type["DeviceBase"]] = {}
+_device_list_size = -1
+
 
 def get_device_list() -> Dict[str, Type["DeviceBase"]]:
-    return {d.Model: d for d in DeviceBase._implementations}
+    global _device_list, _device_list_size
+    # Implementations are only ever appended, on class definition, so the number of
+    # them tells whether the cached table is up to date.
+    if _device_list_size != len(DeviceBase._implementations):
+        _device_list = {d.Model: d for d in DeviceBase._implementations}
+        _device_list_size = len(DeviceBase._implementations)
+    return _device_list
 
 
 def get_device_configuration() -> Dict[str, Union[str, Dict[str, str]]]:
@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+from neclib.core.security import lambdify
+
+
+class TestLambdify:
+    def test_scaled(self) -> None:
+        assert lambdify("x * 10")(2) == 20
+        assert lambdify("10 * x")(2) == 20
+        assert lambdify("x / 4")(2) == 0.5
+
+    def test_shifted(self) -> None:
+        assert lambdify("x + 2")(1) == 3
+        assert lambdify("2 - x")(1) == 1
+        assert lambdify("-x")(1) == -1
+
+    def test_compound(self) -> None:
+        assert lambdify("(x - 1) * 2 ** 3 + 1 / 4")(2) == 8.25
+        assert lambdify("x ** 2 + x")(3) == 12
+
+    def test_constant(self) -> None:
+        assert lambdify("1")(100) == 1
+        assert lambdify("2 * 3")(100) == 6
+
+    def test_other_variable_name(self) -> None:
+        assert lambdify("mV / 3", "mV")(6) == 2
+
+    def test_array_input(self) -> None:
+        np.testing.assert_array_equal(
+            lambdify("10000 * x")(np.array([1.0, 2.0])), [10000.0, 20000.0]
+        )
+
+    def test_fail_unknown_variable(self) -> None:
+        with pytest.raises(ValueError):
+            lambdify("x + y")
+
+    def test_fail_non_arithmetic(self) -> None:
+        with pytest.raises(ValueError):
+            lambdify("x.real")
+        with pytest.raises(ValueError):
+            lambdify("x if x else 0")
+        with pytest.raises(ValueError):
+            lambdify("'x'")
+
+    def test_disallow_too_long_expression(self) -> None:
+        with pytest.raises(ValueError):
+            lambdify("x * " * 25 + "x")
@@ -1,14 +1,17 @@
+import ctypes
+import sys
+from types import SimpleNamespace
+
+import astropy.units as u
+import numpy as np
 import pytest
 
 from neclib.devices.ad_converter.cpz3177 import CPZ3177
 
-from ..conftest import get_instance
-
-pytestmark = pytest.mark.skipif(
-    get_instance(CPZ3177) is None, reason="CPZ3177 is not configured"
-)
+from ..conftest import get_instance, make_instance
 
 
+@pytest.mark.skipif(get_instance(CPZ3177) is None, reason="CPZ3177 is not configured")
 class TestCPZ3177:
     def test_config_type(self):
         ad_converter = get_instance(CPZ3177)
@@ -18,3 +21,111 @@ class TestCPZ3177:
         assert type(ad_converter.Config.single_diff) is str
         assert type(ad_converter.Config.all_ch_num) is int
         assert type(ad_converter.Config.ch_range) is str
+
+
+class FakeBoard:
+    def __init__(self) -> None:
+        self.smpl_count = 0
+
+    def stop_sampling(self):
+        pass
+
+    def initialize(self):
+        pass
+
+    def set_sampling_config(self, smpl_ch_req, smpl_num, **kwargs):
+        self.all_ch_num = len(smpl_ch_req)
+        self.smpl_num = smpl_num
+
+    def start_sampling(self, mode):
+        data = (ctypes.c_float * (self.smpl_num * self.all_ch_num))()
+        self.buffer = SimpleNamespace(get_obj=lambda: data)
+
+    def get_status(self):
+        return {"smpl_count": self.smpl_count}
+
+    def fill(self, start, stop, value):
+        buf = np.ctypeslib.as_array(self.buffer.get_obj())
+        buf.reshape(self.smpl_num, -1)[start:stop] = value
+
+
+class TestCPZ3177Logic:
+    @pytest.fixture
+    def make_ad_converter(self, monkeypatch):
+        board = FakeBoard()
+        pyinterface = SimpleNamespace(open=lambda model, rsw_id: board)
+        monkeypatch.setitem(sys.modules, "pyinterface", pyinterface)
+
+        def make(smpl_freq):
+            return make_instance(
+                CPZ3177,
+                rsw_id=0,
+                ave_num=4,
+                smpl_freq=smpl_freq,
+                single_diff="DIFF",
+                all_ch_num=1,
+                ch_range="5V",
+                channel={"sis_V": 1},
+                converter=[{"ch": "sis_V", "func": "x * 1000", "units": "mV"}],
+            )
+
+        return make
+
+    def test_partially_filled(self, make_ad_converter):
+        ad_converter = make_ad_converter(smpl_freq=1)
+        board = ad_converter.ad
+        board.fill(0, 2, 3.0)
+        board.smpl_count = 2
+        assert ad_converter.get_all_values() == pytest.approx([3.0])
+
+    def test_observed_wrap(self, make_ad_converter):
+        ad_converter = make_ad_converter(smpl_freq=1)
+        board = ad_converter.ad
+        board.fill(0, 998, 5.0)
+        board.smpl_count = 998
+        ad_converter.get_all_values()
+        board.fill(998, 1000, 1.0)
+        board.fill(0, 2, 3.0)
+        board.smpl_count = 2
+        assert ad_converter.get_all_values() == pytest.approx([2.0])
+
+    def test_unobserved_wrap(self, make_ad_converter):
+        # A round of the ring buffer takes 1 us, so it's full at the first read.
+        ad_converter = make_ad_converter(smpl_freq=10**9)
+        board = ad_converter.ad
+        board.fill(998, 1000, 1.0)
+        board.fill(0, 2, 3.0)
+        board.smpl_count = 2
+        assert ad_converter.get_all_values() == pytest.approx([2.0])
+
+    def test_unobserved_wrap_to_zero(self, make_ad_converter):
+        ad_converter = make_ad_converter(smpl_freq=10**9)
+        board = ad_converter.ad
+        board.fill(996, 1000, 1.0)
+        board.smpl_count = 0
+        assert ad_converter.get_all_values() == pytest.approx([1.0])
+
+    def test_nothing_sampled(self, make_ad_converter):
+        ad_converter = make_ad_converter(smpl_freq=1)
+        assert np.isnan(ad_converter.get_all_values()).all()
+        assert np.isnan(ad_converter._get_value(0))
+
+    def test_restarted_sampling(self, make_ad_converter):
+        ad_converter = make_ad_converter(smpl_freq=1)
+        board = ad_converter.ad
+        board.fill(0, 4, 1.0)
+        board.smpl_count = 4
+        assert ad_converter.get_all_values() == pytest.approx([1.0])
+        ad_converter.finalize()
+        board.start_sampling("ASYNC")
+        board.fill(0, 4, 2.0)
+        assert ad_converter.get_all_values() == pytest.approx([2.0])
+
+    def test_converter_units_kept_as_str(self, make_ad_converter):
+        ad_converter = make_ad_converter(smpl_freq=1)
+        board = ad_converter.ad
+        board.fill(0, 4, 1.0)
+        board.smpl_count = 4
+        assert type(ad_converter.converter[0]["units"]) is str
+        assert ad_converter.get_from_id("sis_V") == 1000 * u.mV
+        assert ad_converter.get_all("sis") == {"sis_V": 1000 * u.mV}
@@ -1,17 +1,79 @@
+from types import SimpleNamespace
+
+import astropy.units as u
 import pytest
 
+from neclib.devices.attenuator import a11713b
 from neclib.devices.attenuator.a11713b import A11713B
 
-from ..conftest import get_instance
-
-pytestmark = pytest.mark.skipif(
-    get_instance(A11713B) is None, reason="11713B is not configured"
-)
+from ..conftest import get_instance, make_instance
 
 
+@pytest.mark.skipif(get_instance(A11713B) is None, reason="11713B is not configured")
 class TestA11713B:
     def test_config_type(self):
         attenuator = get_instance(A11713B)
         assert type(attenuator.Config.communicator) is str
         assert type(attenuator.Config.host) is str
         assert type(attenuator.Config.model) is str
+
+
+class FakeAgilent:
+    def __init__(self, com):
+        self.com = com
+        self.level = {"X": 10.0, "Y": 10.0}
+        self.written = []
+
+    def att_model_query(self, ch):
+        return "AG8494"
+
+    def att_level_query(self, ch):
+        return self.level[ch]
+
+    def att_level_set(self, dB, ch):
+        self.level[ch] = dB
+        self.written.append((ch, dB))
+
+
+class TestA11713BLogic:
+    @pytest.fixture
+    def make_attenuator(self, monkeypatch):
+        ogameasure = SimpleNamespace(
+            ethernet=lambda host, port: SimpleNamespace(close=lambda: None),
+            Agilent=SimpleNamespace(agilent_11713B=FakeAgilent),
+        )
+        monkeypatch.setattr(a11713b, "ogameasure", ogameasure)
+        return lambda **config: make_instance(
+            A11713B,
+            communicator="LAN",
+            host="192.168.100.1",
+            lan_port=5025,
+            model={"if1": "AG8494g"},
+            channel={"if1": "X"},
+            **config,
+        )
+
+    def test_query_every_read_by_default(self, make_attenuator):
+        attenuator = make_attenuator()
+        assert attenuator.get_loss("if1") == 10.0 * u.dB
+        attenuator.io.level["X"] = 5.0
+        assert attenuator.get_loss("if1") == 5.0 * u.dB
+
+    def test_cached_loss_is_copied(self, make_attenuator):
+        attenuator = make_attenuator(get_ttl_sec=60)
+        loss = attenuator.get_loss("if1")
+        loss += 1 * u.dB
+        assert attenuator.get_loss("if1") == 10.0 * u.dB
+
+    def test_write_same_loss_by_default(self, make_attenuator):
+        attenuator = make_attenuator()
+        attenuator.set_loss(10, "if1")
+        attenuator.set_loss(10, "if1")
+        assert attenuator.io.written == [("X", 10), ("X", 10)]
+
+    def test_skip_unchanged_ignores_read_value(self, make_attenuator):
+        attenuator = make_attenuator(skip_unchanged=True)
+        assert attenuator.get_loss("if1") == 10.0 * u.dB
+        attenuator.set_loss(10, "if1")
+        attenuator.set_loss(10, "if1")
+        assert attenuator.io.written == [("X", 10)]
@@ -1,17 +1,83 @@
+from types import SimpleNamespace
+
+import astropy.units as u
 import pytest
 
+from neclib.devices.attenuator import a11713c
 from neclib.devices.attenuator.a11713c import A11713C
 
-from ..conftest import get_instance
-
-pytestmark = pytest.mark.skipif(
-    get_instance(A11713C) is None, reason="11713C is not configured"
-)
+from ..conftest import get_instance, make_instance
 
 
+@pytest.mark.skipif(get_instance(A11713C) is None, reason="11713C is not configured")
 class TestA11713C:
     def test_config_type(self):
         attenuator = get_instance(A11713C)
         assert type(attenuator.Config.communicator) is str
         assert type(attenuator.Config.host) is str
         assert type(attenuator.Config.model) is str
+
+
+class FakeAgilent:
+    def __init__(self, com):
+        self.com = com
+        self.level = {(1, "X"): 10.0, (1, "Y"): 20.0}
+        self.written = []
+
+    def att_model_query(self, ch, bank):
+        return "AG8494"
+
+    def att_level_query(self, ch, bank):
+        return self.level[(bank, ch)]
+
+    def att_level_set(self, dB, ch, bank):
+        self.level[(bank, ch)] = dB
+        self.written.append((bank, ch, dB))
+
+
+class TestA11713CLogic:
+    @pytest.fixture
+    def make_attenuator(self, monkeypatch):
+        ogameasure = SimpleNamespace(
+            ethernet=lambda host, port: SimpleNamespace(close=lambda: None),
+            Agilent=SimpleNamespace(agilent_11713C=FakeAgilent),
+        )
+        monkeypatch.setattr(a11713c, "ogameasure", ogameasure)
+        return lambda **config: make_instance(
+            A11713C,
+            communicator="LAN",
+            host="192.168.100.1",
+            lan_port=5025,
+            model={"if1": "AG8494g", "if2": "AG8494g"},
+            channel={"if1": "1X", "if2": "1Y"},
+            **config,
+        )
+
+    def test_query_every_read_by_default(self, make_attenuator):
+        attenuator = make_attenuator()
+        assert attenuator.get_loss("if1") == 10.0 * u.dB
+        attenuator.io.level[(1, "X")] = 5.0
+        assert attenuator.get_loss("if1") == 5.0 * u.dB
+        assert attenuator.get_loss_all() == {"if1": 5.0 * u.dB, "if2": 20.0 * u.dB}
+
+    def test_cached_loss_is_copied(self, make_attenuator):
+        attenuator = make_attenuator(get_ttl_sec=60)
+        loss = attenuator.get_loss("if1")
+        loss += 1 * u.dB
+        assert attenuator.get_loss("if1") == 10.0 * u.dB
+        losses = attenuator.get_loss_all()
+        losses["if2"] *= 2
+        assert attenuator.get_loss_all()["if2"] == 20.0 * u.dB
+
+    def test_write_same_loss_by_default(self, make_attenuator):
+        attenuator = make_attenuator()
+        attenuator.set_loss(10, "if1")
+        attenuator.set_loss(10, "if1")
+        assert attenuator.io.written == [(1, "X", 10), (1, "X", 10)]
+
+    def test_skip_unchanged_ignores_read_value(self, make_attenuator):
+        attenuator = make_attenuator(skip_unchanged=True)
+        assert attenuator.get_loss("if1") == 10.0 * u.dB
+        attenuator.set_loss(10, "if1")
+        attenuator.set_loss(10, "if1")
+        assert attenuator.io.written == [(1, "X", 10)]
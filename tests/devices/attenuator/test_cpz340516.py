@@ -1,17 +1,65 @@
+import sys
+from types import SimpleNamespace
+
 import pytest
 
 from neclib.devices.attenuator.cpz340516 import CPZ340516
 
-from ..conftest import get_instance
+from ..conftest import get_instance, make_instance
+
 
-pytestmark = pytest.mark.skipif(
+@pytest.mark.skipif(
     get_instance(CPZ340516) is None, reason="cpz340516 is not configured"
 )
-
-
 class TestRhio10:
     def test_config_type(self):
         attenuator = get_instance(CPZ340516)
         assert type(attenuator.Config.rsw_id) is int
         assert type(attenuator.Config.range) is str
         assert type(attenuator.Config.rate) is float
+
+
+class FakeBoard:
+    def __init__(self) -> None:
+        self.outputrange = {}
+        self.written = []
+
+    def set_outputrange(self, ch, outputrange):
+        if not 1 <= ch <= 8:
+            raise IndexError(ch)
+        self.outputrange[ch] = outputrange
+
+    def output_current(self, ch, current):
+        self.written.append((ch, self.outputrange.get(ch), current))
+
+
+class TestCPZ340516Logic:
+    @pytest.fixture
+    def make_attenuator(self, monkeypatch):
+        board = FakeBoard()
+        pyinterface = SimpleNamespace(open=lambda model, rsw_id: board)
+        monkeypatch.setitem(sys.modules, "pyinterface", pyinterface)
+        return lambda channel: make_instance(
+            CPZ340516, rsw_id=0, range="DA0_100mA", rate=0.1, channel=channel
+        )
+
+    @pytest.fixture
+    def attenuator(self, make_attenuator):
+        return make_attenuator({"lo": 1})
+
+    def test_invalid_channel(self, make_attenuator):
+        with pytest.raises(ValueError):
+            make_attenuator({"lo": 9})
+
+    def test_skip_unchanged_current(self, attenuator):
+        attenuator.set_current(10.0, "lo")
+        attenuator.apply_current()
+        attenuator.apply_current()
+        assert attenuator.io.written.count((1, "DA0_100mA", 10.0)) == 1
+
+    def test_rewrite_after_range_change(self, attenuator):
+        attenuator.set_current(1.0, "lo")
+        attenuator.apply_current()
+        attenuator.set_outputrange(1, "DA0_1mA")
+        attenuator.apply_current()
+        assert attenuator.io.written[-1] == (1, "DA0_1mA", 1.0)
@@ -0,0 +1,118 @@
+import threading
+import time
+
+import pytest
+
+from neclib.devices.attenuator import _gpib_bus
+from neclib.devices.attenuator._gpib_bus import GPIBBus
+
+
+class FakeEthernet:
+    def __init__(self, host, port, timeout=3):
+        self.connection = False
+        self.n_close = 0
+
+    def open(self):
+        self.connection = True
+
+    def close(self):
+        self.connection = False
+        self.n_close += 1
+
+
+class FakeDevice:
+    def __init__(self, com):
+        self.com = com
+        com.com.open()
+
+    def where(self):
+        return threading.current_thread().name
+
+    def wait(self, started, event):
+        started.set()
+        return event.wait(timeout=1)
+
+
+@pytest.fixture(autouse=True)
+def fake_ethernet(monkeypatch):
+    monkeypatch.setattr(_gpib_bus.ogameasure, "ethernet", FakeEthernet)
+    yield
+    GPIBBus._instances.clear()
+
+
+class TestGPIBBus:
+    def test_commands_run_on_bus_thread(self):
+        bus = GPIBBus.get("192.168.100.1")
+        io = bus.proxy(1, FakeDevice)
+        assert io.where() == bus.name
+        io.com.close()
+
+    def test_shared_between_devices(self):
+        bus1 = GPIBBus.get("192.168.100.1")
+        io1 = bus1.proxy(1, FakeDevice)
+        bus2 = GPIBBus.get("192.168.100.1")
+        io2 = bus2.proxy(2, FakeDevice)
+        assert bus1 is bus2
+
+        io1.com.close()
+        assert io2.where() == bus2.name
+        io2.com.close()
+        bus2.join(timeout=1)
+        assert not bus2.is_alive()
+        assert bus2.com.n_close == 1
+
+    def test_double_close(self):
+        bus = GPIBBus.get("192.168.100.1")
+        io1 = bus.proxy(1, FakeDevice)
+        io2 = GPIBBus.get("192.168.100.1").proxy(2, FakeDevice)
+        io1.com.close()
+        io1.com.close()
+        assert bus.is_alive()
+        assert io2.where() == bus.name
+        io2.com.close()
+
+    def test_call_after_shutdown(self):
+        bus = GPIBBus.get("192.168.100.1")
+        io = bus.proxy(1, FakeDevice)
+        io.com.close()
+        bus.join(timeout=1)
+        with pytest.raises(RuntimeError):
+            io.where()
+
+    def test_new_bus_after_shutdown(self):
+        bus1 = GPIBBus.get("192.168.100.1")
+        bus1.proxy(1, FakeDevice).com.close()
+        bus2 = GPIBBus.get("192.168.100.1")
+        assert bus2 is not bus1
+        io = bus2.proxy(1, FakeDevice)
+        assert io.where() == bus2.name
+        io.com.close()
+
+    def test_method_wrapper_cached(self):
+        io = GPIBBus.get("192.168.100.1").proxy(1, FakeDevice)
+        assert io.where is io.where
+        io.com.close()
+
+    def test_shutdown_all_drains_queue(self):
+        bus = GPIBBus.get("192.168.100.1")
+        io = bus.proxy(1, FakeDevice)
+        started, event = threading.Event(), threading.Event()
+        results = []
+        callers = [
+            threading.Thread(target=lambda: results.append(io.wait(started, event))),
+            threading.Thread(target=lambda: results.append(io.where())),
+        ]
+        callers[0].start()
+        assert started.wait(timeout=1)
+        callers[1].start()
+        while bus._queue.empty():
+            # Wait until the second command is queued behind the running one.
+            time.sleep(0.01)
+
+        threading.Timer(0.1, event.set).start()
+        GPIBBus.shutdown_all()
+        for caller in callers:
+            caller.join(timeout=1)
+        assert set(results) == {True, bus.name}
+        assert not bus.is_alive()
+        assert GPIBBus._instances == {}
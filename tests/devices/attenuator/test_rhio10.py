@@ -1,16 +1,72 @@
+from types import SimpleNamespace
+
+import astropy.units as u
 import pytest
 
+from neclib.devices.attenuator import rhio10
 from neclib.devices.attenuator.rhio10 import RHIO10
 
-from ..conftest import get_instance
-
-pytestmark = pytest.mark.skipif(
-    get_instance(RHIO10) is None, reason="rhio10 is not configured"
-)
+from ..conftest import get_instance, make_instance
 
 
+@pytest.mark.skipif(get_instance(RHIO10) is None, reason="rhio10 is not configured")
 class TestRhio10:
     def test_config_type(self):
         attenuator = get_instance(RHIO10)
         assert type(attenuator.Config.host) is str
         assert type(attenuator.Config.port) is int
+
+
+class FakeADIOS:
+    def __init__(self, com):
+        self.com = com
+        self.level = {1: 10, 2: 20}
+        self.written = []
+
+    def get_att1(self):
+        return self.level[1]
+
+    def get_att2(self):
+        return self.level[2]
+
+    def _set_att(self, ch, dB):
+        self.level[ch] = dB
+        self.written.append((ch, dB))
+
+
+class TestRhio10Logic:
+    @pytest.fixture
+    def make_attenuator(self, monkeypatch):
+        ogameasure = SimpleNamespace(
+            ethernet=lambda host, port: SimpleNamespace(close=lambda: None),
+            SENA=SimpleNamespace(adios=FakeADIOS),
+        )
+        monkeypatch.setattr(rhio10, "ogameasure", ogameasure)
+        return lambda **config: make_instance(
+            RHIO10, host="192.168.100.1", port=10001, channel={"if1": 1}, **config
+        )
+
+    def test_query_every_read_by_default(self, make_attenuator):
+        attenuator = make_attenuator()
+        assert attenuator.get_loss("if1") == 10 * u.dB
+        attenuator.io.level[1] = 5
+        assert attenuator.get_loss("if1") == 5 * u.dB
+
+    def test_cached_loss_is_copied(self, make_attenuator):
+        attenuator = make_attenuator(get_ttl_sec=60)
+        loss = attenuator.get_loss("if1")
+        loss += 1 * u.dB
+        assert attenuator.get_loss("if1") == 10 * u.dB
+
+    def test_write_same_loss_by_default(self, make_attenuator):
+        attenuator = make_attenuator()
+        attenuator.set_loss(10, "if1")
+        attenuator.set_loss(10, "if1")
+        assert attenuator.io.written == [(1, 10), (1, 10)]
+
+    def test_skip_unchanged_ignores_read_value(self, make_attenuator):
+        attenuator = make_attenuator(skip_unchanged=True)
+        assert attenuator.get_loss("if1") == 10 * u.dB
+        attenuator.set_loss(10, "if1")
+        attenuator.set_loss(10, "if1")
+        assert attenuator.io.written == [(1, 10)]
@@ -1,4 +1,5 @@
-from typing import Optional, Type, TypeVar
+from types import SimpleNamespace
+from typing import Any, Optional, Type, TypeVar
 
 from neclib.devices.device_base import DeviceBase
 
@@ -11,3 +12,22 @@ def get_instance(type: Type[T]) -> Optional[T]:
         lambda x: x.Manufacturer == type.Manufacturer, model_match
     )
     return next(manufacturer_match, None)
+
+
+def make_instance(cls: Type[T], **config: Any) -> T:
+    """Instantiate ``cls`` with ``config``, without registering it as a device.
+
+    Initialization is run even in simulator mode.
+    """
+    Device = type(
+        cls.__name__,
+        (cls,),
+        dict(
+            Config=SimpleNamespace(**config),
+            _instances={},
+            _initialized=False,
+            _is_autogenerated=True,
+            __init__=getattr(cls.__init__, "__wrapped__", cls.__init__),
+        ),
+    )
+    return Device()
@@ -1,15 +1,49 @@
+import sys
+from types import SimpleNamespace
+
 import pytest
 
 from neclib.devices.da_converter.cpz340816 import CPZ340816
 
-from ..conftest import get_instance
+from ..conftest import get_instance, make_instance
+
 
-pytestmark = pytest.mark.skipif(
+@pytest.mark.skipif(
     get_instance(CPZ340816) is None, reason="CPZ340816 is not configured"
 )
-
-
 class TestCPZ340816:
     def test_config_type(self):
         da_converter = get_instance(CPZ340816)
         assert type(da_converter.Config.rsw_id) is int
+
+
+class FakeBoard:
+    def __init__(self) -> None:
+        self.written = []
+
+    def output_da(self, ch, voltage):
+        self.written.append((ch, voltage))
+
+
+class TestCPZ340816Logic:
+    @pytest.fixture
+    def da_converter(self, monkeypatch):
+        board = FakeBoard()
+        pyinterface = SimpleNamespace(open=lambda model, rsw_id: board)
+        monkeypatch.setitem(sys.modules, "pyinterface", pyinterface)
+        return make_instance(
+            CPZ340816,
+            rsw_id=0,
+            channel={"sis": 1},
+            max_mv=[-100, 100],
+            converter={"sis": "x / 1000"},
+        )
+
+    def test_write_every_channel(self, da_converter):
+        da_converter.set_voltage(10.0, "sis")
+        da_converter.apply_voltage()
+        da_converter.apply_voltage()
+        written = da_converter.da.written
+        assert len(written) == 32
+        assert written[:16] == written[16:]
+        assert (1, 0.01) in written[:16]
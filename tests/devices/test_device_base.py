@@ -1,3 +1,4 @@
+import copy
 from abc import abstractmethod
 from typing import Any
 
@@ -257,3 +258,37 @@ class TestDevices(configured_tester_factory("config_devices")):
         Motor = Devices(motor1=MyMotor1, motor2=MyMotor2)
         motor1 = Motor["motor1"]()
         assert isinstance(motor1, MyMotor1)
+
+    def test_method_lookup_follows_item_change(self) -> None:
+        MyMotor1 = DeviceBase.bind("my_motor_1", "motor_model_1")
+        MyMotor2 = DeviceBase.bind("my_motor_2", "motor_model_2")
+        motor = Devices(motor1=MyMotor1)()
+        assert motor.get_id is motor.get_id
+        assert motor.get_id() == {"motor1": 1}
+        motor["motor2"] = MyMotor2()
+        assert motor.get_id() == {"motor1": 1, "motor2": 2}
+        del motor["motor1"]
+        assert motor.get_id() == {"motor2": 2}
+
+    def test_normalized_getitem_follows_item_change(self) -> None:
+        MyMotor1 = DeviceBase.bind("my_motor_1", "motor_model_1")
+        MyMotor2 = DeviceBase.bind("my_motor_2", "motor_model_2")
+        motor = Devices(motor_1=MyMotor1)()
+        assert motor["Motor1"].get_id() == 1
+        motor["motor_2"] = MyMotor2()
+        assert motor["Motor2"].get_id() == 2
+        del motor["motor_1"]
+        with pytest.raises(KeyError):
+            motor["Motor1"]
+
+    def test_method_lookup_on_copy(self) -> None:
+        MyMotor1 = DeviceBase.bind("my_motor_1", "motor_model_1")
+        MyMotor2 = DeviceBase.bind("my_motor_2", "motor_model_2")
+        motor = Devices(motor1=MyMotor1)()
+        assert motor.get_id() == {"motor1": 1}
+        copied = copy.copy(motor)
+        copied["motor2"] = MyMotor2()
+        del copied["motor1"]
+        assert motor.get_id() == {"motor1": 1}
+        assert copied.get_id() == {"motor2": 2}
+        assert copy.copy(motor).get_id is not motor.get_id
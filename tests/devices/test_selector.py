@@ -17,3 +17,22 @@ class TestSelector:
         }
         for name, v in configured_devices.items():
             assert v in repr(getattr(devices, name))
+
+    def test_device_list_follows_new_implementations(self):
+        from neclib.devices.device_base import DeviceBase
+        from neclib.devices.selector import get_device_list
+
+        before = get_device_list()
+        assert get_device_list() is before
+
+        class _Kind(DeviceBase):
+            def finalize(self) -> None:
+                pass
+
+        class _Impl(_Kind):
+            Model = "SelectorTestModel"
+            Manufacturer = "???"
+
+        after = get_device_list()
+        assert after["SelectorTestModel"] is _Impl
+        assert "SelectorTestModel" not in before